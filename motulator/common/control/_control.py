@@ -1,5 +1,7 @@
 """Common functions and classes for controls."""
 
+import cmath
+import math
 from abc import ABC, abstractmethod
 from types import SimpleNamespace
 
@@ -39,11 +41,15 @@ class PWM:
     
     """
 
+    __slots__ = (
+        "six_step", "k_comp", "realized_voltage", "_old_u_cs", "_comp_cache")
+
     def __init__(self, six_step=False, k_comp=1.5):
         self.six_step = six_step
         self.k_comp = k_comp
         self.realized_voltage = 0
         self._old_u_cs = 0
+        self._comp_cache = (0., 1. + 0j)
 
     @staticmethod
     def six_step_overmodulation(ref_u_cs, u_dc):
@@ -74,27 +80,27 @@ class PWM:
 
         """
         # Limited magnitude
-        r = np.min([np.abs(ref_u_cs), 2/3*u_dc])
+        r = min(abs(ref_u_cs), 2/3*u_dc)
 
-        if np.sqrt(3)*r > u_dc:
+        if math.sqrt(3)*r > u_dc:
             # Angle and sector of the reference vector
-            theta = np.angle(ref_u_cs)
-            sector = np.floor(3*theta/np.pi)
+            theta = cmath.phase(ref_u_cs)
+            sector = math.floor(3*theta/math.pi)
 
             # Angle reduced to the first sector (at which sector == 0)
-            theta0 = theta - sector*np.pi/3
+            theta0 = theta - sector*math.pi/3
 
             # Intersection angle, see Eq. (9)
-            alpha_g = np.pi/6 - np.arccos(u_dc/(np.sqrt(3)*r))
+            alpha_g = math.pi/6 - math.acos(u_dc/(math.sqrt(3)*r))
 
             # Modify the angle according to Eq. (4)
-            if alpha_g <= theta0 <= np.pi/6:
+            if alpha_g <= theta0 <= math.pi/6:
                 theta0 = alpha_g
-            elif np.pi/6 <= theta0 <= np.pi/3 - alpha_g:
-                theta0 = np.pi/3 - alpha_g
+            elif math.pi/6 <= theta0 <= math.pi/3 - alpha_g:
+                theta0 = math.pi/3 - alpha_g
 
             # Modified reference voltage
-            ref_u_cs = r*np.exp(1j*(theta0 + sector*np.pi/3))
+            ref_u_cs = r*cmath.exp(1j*(theta0 + sector*math.pi/3))
 
         return ref_u_cs
 
@@ -123,7 +129,7 @@ class PWM:
         u_abc = complex2abc(ref_u_cs)
 
         # Zero-sequence voltage resulting in space-vector PWM
-        u_0 = .5*(np.amax(u_abc) + np.amin(u_abc))
+        u_0 = .5*(max(u_abc) + min(u_abc))
         u_abc -= u_0
 
         # Uncommenting the following lines results in minimum-phase-error
@@ -164,9 +170,13 @@ class PWM:
         
         """
         # Advance the angle due to the computational delay (N*T_s) and the ZOH
-        # (PWM) delay (0.5*T_s), typically 1.5*T_s*w
+        # (PWM) delay (0.5*T_s), typically 1.5*T_s*w. The rotation factor is
+        # memoized, since the compensation angle repeats from one sampling
+        # period to the next whenever T_s and w stay constant.
         theta_comp = self.k_comp*T_s*w
-        ref_u_cs = np.exp(1j*theta_comp)*ref_u_cs
+        if theta_comp != self._comp_cache[0]:
+            self._comp_cache = (theta_comp, cmath.exp(1j*theta_comp))
+        ref_u_cs = self._comp_cache[1]*ref_u_cs
 
         # Modify angle in the overmodulation region
         if self.six_step:
@@ -239,6 +249,8 @@ class PIController:
 
     """
 
+    __slots__ = ("max_u", "k_p", "k_t", "alpha_i", "v", "u_i")
+
     def __init__(self, k_p, k_i, k_t=None, max_u=np.inf):
         self.max_u = max_u
         # Gains
@@ -272,7 +284,7 @@ class PIController:
         u = self.k_t*(ref_y - y) + self.v
 
         # Limit the controller output
-        u = np.clip(u, -self.max_u, self.max_u)
+        u = min(max(u, -self.max_u), self.max_u)
 
         return u
 
@@ -330,6 +342,8 @@ class ComplexPIController:
 
     """
 
+    __slots__ = ("k_p", "k_t", "alpha_i", "v", "u_i")
+
     def __init__(self, k_p, k_i, k_t=None):
         # Gains
         self.k_p = k_p
@@ -392,6 +406,8 @@ class RateLimiter:
 
     """
 
+    __slots__ = ("rate_limit", "_old_y")
+
     def __init__(self, rate_limit=np.inf):
         self.rate_limit = rate_limit
         self._old_y = 0
@@ -438,6 +454,8 @@ class RateLimiter:
 class Clock:
     """Digital clock."""
 
+    __slots__ = ("t", "t_reset")
+
     def __init__(self):
         self.t = 0
         self.t_reset = 1e9
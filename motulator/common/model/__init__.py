@@ -1,4 +1,5 @@
 """Common functions and classes for continuous-time system models."""
+from motulator.common.model._parallel import simulate_parallel
 from motulator.common.model._simulation import (
     CarrierComparison, Delay, Model, Simulation, Subsystem)
 #from motulator.common.model._converter import Inverter, FrequencyConverter
@@ -8,6 +9,7 @@ __all__ = [
     "Delay",
     "Model",
     "Simulation",
+    "simulate_parallel",
     "Subsystem",
     #    "Inverter",
     #    "FrequencyConverter",
@@ -6,6 +6,7 @@ front-end rectifier are modeled. Complex space vectors are used also for duty
 ratios and switching states, wherever applicable. 
 
 """
+import math
 from types import SimpleNamespace
 
 import numpy as np
@@ -44,7 +45,10 @@ class Inverter(Subsystem):
     @property
     def i_dc(self):
         """DC-side current (A)."""
-        return 1.5*np.real(self.inp.q_cs*np.conj(self.inp.i_cs))
+        # Plain scalar arithmetic avoids NumPy dispatch on this per-substep
+        # path, cf. 1.5*np.real(q_cs*np.conj(i_cs))
+        q_cs, i_cs = self.inp.q_cs, self.inp.i_cs
+        return 1.5*(q_cs.real*i_cs.real + q_cs.imag*i_cs.imag)
 
     def set_outputs(self, _):
         """Set output variables."""
@@ -121,17 +125,23 @@ class FrequencyConverter(Inverter):
         super().set_outputs(t)
         self.out.u_dc, self.out.i_L = self.state.u_dc.real, self.state.i_L.real
         self.out.i_dc = self.i_dc.real
-        # Grid phase voltages
-        self.out.u_g_abc = self.grid_voltages(t)
+        # Grid phase voltages, computed with scalar math since this method
+        # runs on every solver substep
+        theta_g = self.par.w_g*t
+        self.out.u_g_abc = (
+            self.par.u_g*math.cos(theta_g),
+            self.par.u_g*math.cos(theta_g - 2*math.pi/3),
+            self.par.u_g*math.cos(theta_g - 4*math.pi/3))
 
     def rhs(self):
         """Compute state derivatives."""
         state, out, par = self.state, self.out, self.par
         # Output voltage of the diode bridge
-        u_di = np.amax(out.u_g_abc, axis=0) - np.amin(out.u_g_abc, axis=0)
-        # State derivatives
+        u_di = max(out.u_g_abc) - min(out.u_g_abc)
+        # State derivatives, where the DC current is recomputed since the
+        # stator current input is refreshed in the interconnection step
         d_u_dc = (state.i_L - self.i_dc)/par.C
-        d_i_L = (u_di - self.u_dc)/par.L
+        d_i_L = (u_di - out.u_dc)/par.L
         # The inductor current cannot be negative due to the diode bridge
         if state.i_L < 0 and d_i_L < 0:
             d_i_L = 0
@@ -141,21 +151,27 @@ class FrequencyConverter(Inverter):
     def post_process_states(self):
         """Post-process data."""
         data = self.data
-        data.u_dc, data.i_L = data.u_dc.real, data.i_L.real
+        # Contiguous real-valued trajectories for the DC-bus quantities
+        data.u_dc = np.ascontiguousarray(data.u_dc.real)
+        data.i_L = np.ascontiguousarray(data.i_L.real)
         data.u_cs = data.q_cs*data.u_dc
 
     def post_process_with_inputs(self):
         """Post-process data with inputs."""
         data = self.data
-        data.i_dc = 1.5*np.real(data.q_cs*np.conj(data.i_cs))
+        # Real/imaginary parts are combined directly to avoid building the
+        # temporary complex product array
+        data.i_dc = 1.5*(
+            data.q_cs.real*data.i_cs.real + data.q_cs.imag*data.i_cs.imag)
         data.u_g_abc = self.grid_voltages(data.t)
         data.u_g = abc2complex(data.u_g_abc)
+        # Compute the phase-voltage envelopes once over the whole trajectory
+        u_g_max = np.amax(data.u_g_abc, axis=0)
+        u_g_min = np.amin(data.u_g_abc, axis=0)
         # Voltage at the output of the diode bridge
-        data.u_di = (
-            np.amax(data.u_g_abc, axis=0) - np.amin(data.u_g_abc, axis=0))
+        data.u_di = u_g_max - u_g_min
         # Diode bridge switching states (-1, 0, 1)
-        data.q_g_abc = (
-            (np.amax(data.u_g_abc, axis=0) == data.u_g_abc).astype(int) -
-            (np.amin(data.u_g_abc, axis=0) == data.u_g_abc).astype(int))
+        data.q_g_abc = ((u_g_max == data.u_g_abc).astype(int) -
+                        (u_g_min == data.u_g_abc).astype(int))
         # Grid current space vector
         data.i_g = abc2complex(data.q_g_abc)*data.i_L
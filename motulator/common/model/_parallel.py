@@ -0,0 +1,81 @@
+"""Parallel execution of independent simulations."""
+
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+
+import numpy as np
+
+from motulator.common.model._simulation import Subsystem
+
+
+def _extract_data(sim):
+    """Collect the post-processed simulation data into a picklable object."""
+    # The model and controller objects themselves typically hold references
+    # to lambdas (load torques, speed references, gain schedules), which
+    # cannot be sent between processes. The post-processed data consists of
+    # plain ndarrays only. The returned object mirrors the attribute layout
+    # of a completed Simulation instance, so the plotting functions accept
+    # it directly.
+    mdl = SimpleNamespace()
+    for name, attr in vars(sim.mdl).items():
+        if isinstance(attr, Subsystem):
+            setattr(mdl, name, SimpleNamespace(data=attr.data))
+
+    return SimpleNamespace(mdl=mdl, ctrl=SimpleNamespace(data=sim.ctrl.data))
+
+
+def _build_and_simulate(factory, t_stop, max_step):
+    """Build and run a single simulation in a worker process."""
+    sim = factory()
+    sim.simulate(t_stop=t_stop, max_step=max_step)
+    return _extract_data(sim)
+
+
+# %%
+def simulate_parallel(factories, t_stop=1, max_step=np.inf, max_workers=None):
+    """
+    Run independent simulations in parallel worker processes.
+
+    The simulation loop is Python-bound, so parameter sweeps benefit from
+    process-based parallelism. Each simulation is constructed inside its own
+    worker process by calling the corresponding factory function. The
+    factories have to be picklable, i.e., module-level functions or
+    `functools.partial` objects rather than lambdas.
+
+    Parameters
+    ----------
+    factories : iterable of callables
+        Zero-argument callables, each returning a `Simulation` instance.
+    t_stop : float, optional
+        Simulation stop time. The default is 1.
+    max_step : float, optional
+        Max step size of the solver. The default is inf.
+    max_workers : int, optional
+        Maximum number of worker processes. If 1, the simulations are run
+        sequentially in the current process, which also lifts the
+        picklability requirement. The default None uses the number of
+        processors.
+
+    Returns
+    -------
+    list of SimpleNamespace
+        Post-processed simulation data, in the order of the factories. Each
+        element mirrors the data layout of a completed `Simulation`
+        instance, i.e., the continuous-time data is in `mdl.<subsystem>.
+        data` and the discrete-time data in `ctrl.data`.
+
+    """
+    factories = list(factories)
+
+    # Serial fallback, useful for single-CPU machines and for debugging
+    if max_workers == 1:
+        return [
+            _build_and_simulate(factory, t_stop, max_step)
+            for factory in factories
+        ]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            _build_and_simulate, factories, len(factories)*[t_stop],
+            len(factories)*[max_step])
+        return list(results)
@@ -22,6 +22,8 @@ class Delay:
 
     """
 
+    __slots__ = ("data", )
+
     def __init__(self, length=1, elem=3):
         self.data = length*[elem*[0]]  # Creates a zero list
 
@@ -138,8 +140,9 @@ class CarrierComparison:
 
         # Assume falling edge and compute the normalized switching instants:
         t_n = np.append(0, np.sort(d_c_abc))
-        # Compute the corresponding switching states:
-        q_c_abc = (t_n[:, np.newaxis] < d_c_abc).astype(int)
+        # Compute the corresponding switching states in the phase-major
+        # (time-last) layout, keeping each phase sequence contiguous:
+        q_c = (t_n < d_c_abc[:, np.newaxis]).astype(int)
 
         # Durations of switching states
         t_steps = T_s*np.diff(t_n, append=1)
@@ -147,13 +150,13 @@ class CarrierComparison:
         # Flip the sequence if rising edge
         if self._rising_edge:
             t_steps = np.flip(t_steps)
-            q_c_abc = np.flipud(q_c_abc)
+            q_c = q_c[:, ::-1]
 
         # Change the carrier direction for the next call
         self._rising_edge = not self._rising_edge
 
-        return ((t_steps, abc2complex(q_c_abc.T)) if self.return_complex else
-                (t_steps, q_c_abc))
+        return ((t_steps, abc2complex(q_c)) if self.return_complex else
+                (t_steps, q_c.T))
 
 
 # %%
@@ -170,16 +173,16 @@ def zoh(T_s, d_c_abc):
 
     Returns
     -------
-    t_steps : ndarray, shape (1,)
-        Sampling period as an array compatible with the solver.
-    q_cs : complex ndarray, shape (1,)
-        Duty ratio vector as an array compatible with the solver.
+    t_steps : tuple, shape (1,)
+        Sampling period in a sequence compatible with the solver loop.
+    q_cs : tuple, shape (1,)
+        Duty ratio vector in a sequence compatible with the solver loop.
 
     """
-    # Shape the output arrays to be compatible with the solver
-    t_steps = np.array([T_s])
-    q_cs = np.array([abc2complex(d_c_abc)])
-    return t_steps, q_cs
+    # Single-element tuples avoid allocating an ndarray on every sampling
+    # period, while still supporting the iteration and indexing needed in
+    # the simulation loop
+    return (T_s, ), (abc2complex(d_c_abc), )
 
 
 # %%
@@ -230,38 +233,43 @@ class Simulation:
     @np.errstate(invalid="raise")
     def _simulation_loop(self, t_stop, max_step):
         """Run the main simulation loop."""
-        while self.mdl.t0 <= t_stop:
+        # Bind the frequently accessed objects to locals for the loop
+        mdl, ctrl = self.mdl, self.ctrl
+        delay, pwm, converter_inp = mdl.delay, mdl.pwm, mdl.converter.inp
+
+        while mdl.t0 <= t_stop:
 
             # Run the digital controller
-            T_s, ref_d_c_abc = self.ctrl(self.mdl)
+            T_s, ref_d_c_abc = ctrl(mdl)
 
             # Computational delay model
-            d_c_abc = self.mdl.delay(ref_d_c_abc)
+            d_c_abc = delay(ref_d_c_abc)
 
             # Carrier comparison
-            t_steps, q_cs = self.mdl.pwm(T_s, d_c_abc)
+            t_steps, q_cs = pwm(T_s, d_c_abc)
 
             # Loop over the sampling period T_s
             for i, t_step in enumerate(t_steps):
 
                 if t_step > 0:
                     # Update the converter switching state
-                    self.mdl.converter.inp.q_cs = q_cs[i]
+                    converter_inp.q_cs = q_cs[i]
 
                     # Get initial values
-                    state0 = self.mdl.get_initial_values()
+                    state0 = mdl.get_initial_values()
 
                     # Integrate over t_span
-                    t_span = (self.mdl.t0, self.mdl.t0 + t_step)
+                    t_span = (mdl.t0, mdl.t0 + t_step)
                     sol = solve_ivp(
-                        self.mdl.rhs, t_span, state0, max_step=max_step)
+                        mdl.rhs, t_span, state0, max_step=max_step)
 
                     # Set the new initial time
-                    self.mdl.t0 = t_span[-1]
+                    mdl.t0 = t_span[-1]
 
-                    # Save the solution
-                    sol.q_cs = len(sol.t)*[q_cs[i]]
-                    self.mdl.save(sol)
+                    # Save the solution. The switching state is constant
+                    # over the step, so a read-only broadcast view suffices.
+                    sol.q_cs = np.broadcast_to(q_cs[i], len(sol.t))
+                    mdl.save(sol)
 
     def save_mat(self, name="sim"):
         """
@@ -302,30 +310,49 @@ class Model(ABC):
         self.converter = None
         self.subsystems = []  # Contains the list of subsystems
         self.sol_t = []
+        self._solver_cache = None
+
+    def _get_solver_cache(self):
+        """Cache the subsystem traversal lists for the solver interface."""
+        # The rhs method is evaluated at every solver substep, so the
+        # hasattr checks and namespace traversals are resolved once here
+        # instead of on every evaluation. The subsystem composition is fixed
+        # after the model has been constructed.
+        if self._solver_cache is None:
+            self._solver_cache = SimpleNamespace(
+                states=[(subsystem.state, list(vars(subsystem.state)))
+                        for subsystem in self.subsystems
+                        if hasattr(subsystem, "state")],
+                set_outputs=[
+                    subsystem.set_outputs for subsystem in self.subsystems
+                    if hasattr(subsystem, "set_outputs")
+                ],
+                rhs=[
+                    subsystem.rhs for subsystem in self.subsystems
+                    if hasattr(subsystem, "rhs")
+                ])
+        return self._solver_cache
 
     def get_initial_values(self):
         """Get initial values of all subsystems before the solver."""
         state0 = []
-        for subsystem in self.subsystems:
-            if hasattr(subsystem, "state"):
-                state0 += list(vars(subsystem.state).values())
+        for state, attrs in self._get_solver_cache().states:
+            state0 += [getattr(state, attr) for attr in attrs]
 
         return state0
 
     def set_states(self, state_list):
         """Set the states in all subsystems."""
         index = 0
-        for subsystem in self.subsystems:
-            if hasattr(subsystem, "state"):
-                for attr in vars(subsystem.state):
-                    setattr(subsystem.state, attr, state_list[index])
-                    index += 1
+        for state, attrs in self._get_solver_cache().states:
+            for attr in attrs:
+                setattr(state, attr, state_list[index])
+                index += 1
 
     def set_outputs(self, t):
         """Compute the output variables."""
-        for subsystem in self.subsystems:
-            if hasattr(subsystem, "set_outputs"):
-                subsystem.set_outputs(t)
+        for set_outputs in self._get_solver_cache().set_outputs:
+            set_outputs(t)
 
     @abstractmethod
     def interconnect(self, t):
@@ -344,35 +371,43 @@ class Model(ABC):
 
         # State derivatives
         rhs_list = []
-        for subsystem in self.subsystems:
-            if hasattr(subsystem, "rhs"):
-                subsystem_rhs = subsystem.rhs()
-                rhs_list += subsystem_rhs
+        for subsystem_rhs in self._get_solver_cache().rhs:
+            rhs_list += subsystem_rhs()
 
         # List of state derivatives
         return rhs_list
 
     def save(self, sol):
         """Save the solution."""
-        self.sol_t.extend(sol.t)
-        self.converter.sol_q_cs.extend(sol.q_cs)
+        # The solver output arrays are stored as chunks, avoiding both the
+        # per-element boxing into Python objects and the O(N) conversion
+        # pass in the post-processing
+        self.sol_t.append(sol.t)
+        self.converter.sol_q_cs.append(sol.q_cs)
 
         index = 0
         for subsystem in self.subsystems:
             if hasattr(subsystem, "sol_states"):
                 for attr in vars(subsystem.sol_states):
-                    subsystem.sol_states.__dict__[attr].extend(sol.y[index])
+                    subsystem.sol_states.__dict__[attr].append(sol.y[index])
                     index += 1
 
     def post_process_states(self):
-        """Transform the lists to the ndarray format and post-process them."""
-        self.converter.data.q_cs = np.asarray(self.converter.sol_q_cs)
+        """Transform the chunk lists to the ndarray format and post-process."""
+        # The chunk lists are empty if the solver failed before the first
+        # save call, in which case empty data arrays are produced
+        sol_q_cs = self.converter.sol_q_cs
+        self.converter.data.q_cs = (
+            np.concatenate(sol_q_cs) if sol_q_cs else np.asarray([]))
+        t = np.concatenate(self.sol_t) if self.sol_t else np.asarray([])
 
         for subsystem in self.subsystems:
-            subsystem.data.t = np.asarray(self.sol_t)
+            subsystem.data.t = t
             if hasattr(subsystem, "sol_states"):
                 for key, value in vars(subsystem.sol_states).items():
-                    setattr(subsystem.data, key, np.asarray(value))
+                    setattr(
+                        subsystem.data, key,
+                        np.concatenate(value) if value else np.asarray([]))
 
             if hasattr(subsystem, "post_process_states"):
                 subsystem.post_process_states()
@@ -3,6 +3,16 @@
 # %%
 import numpy as np
 
+# Constants precomputed at import time for the per-call transformations
+_SQRT_3 = np.sqrt(3)
+_2PI = 2*np.pi
+# Matrix mapping the (real, imag) components to the three-phase quantities
+_COMPLEX2ABC = np.array([
+    [1., 0.],
+    [-.5, _SQRT_3/2],
+    [-.5, -_SQRT_3/2],
+])
+
 
 # %%
 def abc2complex(u):
@@ -27,7 +37,7 @@ def abc2complex(u):
     (-1-0.5773502691896258j)
 
     """
-    return (2/3)*u[0] - (u[1] + u[2])/3 + 1j*(u[1] - u[2])/np.sqrt(3)
+    return (2/3)*u[0] - (u[1] + u[2])/3 + 1j*(u[1] - u[2])/_SQRT_3
 
 
 # %%
@@ -53,9 +63,13 @@ def complex2abc(u):
     array([ 1.       , -0.9330127, -0.0669873])
 
     """
+    if isinstance(u, np.ndarray):
+        # Precomputed matrix-vector form for whole trajectories
+        return _COMPLEX2ABC @ np.array([u.real, u.imag])
+    # Direct construction is faster for the scalar per-tick measurements
     return np.array([
-        u.real, .5*(-u.real + np.sqrt(3)*u.imag),
-        .5*(-u.real - np.sqrt(3)*u.imag)
+        u.real, .5*(-u.real + _SQRT_3*u.imag),
+        .5*(-u.real - _SQRT_3*u.imag)
     ])
 
 
@@ -148,4 +162,4 @@ def wrap(theta):
 
     """
 
-    return np.mod(theta + np.pi, 2*np.pi) - np.pi
+    return np.mod(theta + np.pi, _2PI) - np.pi
@@ -1,5 +1,6 @@
 """Common control functions and classes for for induction machine drives."""
 
+import cmath
 from types import SimpleNamespace
 from dataclasses import dataclass, field, InitVar
 
@@ -140,9 +141,11 @@ class Observer:
         # Get the rotor speed estimate in the sensorless mode
         fbk.w_m = self.est.w_m if self.sensorless else fbk.w_m
 
-        # Current and voltage vectors in estimated rotor flux coordinates
-        fbk.i_s = np.exp(-1j*fbk.theta_s)*fbk.i_ss
-        fbk.u_s = np.exp(-1j*fbk.theta_s)*fbk.u_ss
+        # Current and voltage vectors in estimated rotor flux coordinates,
+        # sharing a single rotation factor between the transforms
+        rot = cmath.exp(-1j*fbk.theta_s)
+        fbk.i_s = rot*fbk.i_ss
+        fbk.u_s = rot*fbk.u_ss
 
         # Stator flux estimate
         fbk.psi_s = par.L_sgm*fbk.i_s + fbk.psi_R
@@ -165,14 +168,15 @@ class Observer:
         # Angular frequencies
         den = fbk.psi_R + par.L_sgm*np.real(
             (1 - k_o1)*fbk.i_s + k_o2*np.conj(fbk.i_s))
-        num = np.imag(v_s + k_o1*(v_r - v_s) + k_o2*np.conj(v_r - v_s))
+        dv_s = v_r - v_s
+        num = np.imag(v_s + k_o1*dv_s + k_o2*np.conj(dv_s))
         fbk.w_s = num/den if den > 0 else fbk.w_m
         fbk.w_r = par.R_R*fbk.i_s.imag/fbk.psi_R if fbk.psi_R > 0 else 0
 
         # Compute and store the derivatives for the update method
         v = v_s - 1j*fbk.w_s*par.L_sgm*fbk.i_s
-        self._work.d_psi_R = np.real(
-            v + k_o1*(v_r - v) + k_o2*np.conj(v_r - v))
+        dv = v_r - v
+        self._work.d_psi_R = np.real(v + k_o1*dv + k_o2*np.conj(dv))
         self._work.d_w_m = gain.alpha_o*(fbk.w_s - fbk.w_r - fbk.w_m)
 
         return fbk
@@ -237,6 +241,9 @@ class FullOrderObserver:
     def __init__(self, cfg):
         self.par, self.gain = cfg.par, cfg.gain
         self.sensorless = cfg.sensorless
+        # Derived parameters, computed once instead of at every sample
+        self.par.R_sgm = self.par.R_s + self.par.R_R
+        self.par.alpha = self.par.R_R/self.par.L_M
         # Initialize the state estimates
         self.est = SimpleNamespace(psi_R=0, i_s=0, theta_s=0, w_m=0)
         # Private work variables for the update method
@@ -250,16 +257,17 @@ class FullOrderObserver:
         """Output."""
 
         # Unpack
-        par, gain = self.par, self.gain,
-        par.R_sgm, par.alpha = par.R_s + par.R_R, par.R_R/par.L_M
+        par, gain = self.par, self.gain
 
         # Get the estimates
         fbk.psi_R, fbk.theta_s = self.est.psi_R, self.est.theta_s
         fbk.w_m = self.est.w_m
 
-        # Current and voltage vectors in estimated rotor flux coordinates
-        fbk.i_s = np.exp(-1j*fbk.theta_s)*fbk.i_ss
-        fbk.u_s = np.exp(-1j*fbk.theta_s)*fbk.u_ss
+        # Current and voltage vectors in estimated rotor flux coordinates,
+        # sharing a single rotation factor between the transforms
+        rot = cmath.exp(-1j*fbk.theta_s)
+        fbk.i_s = rot*fbk.i_ss
+        fbk.u_s = rot*fbk.u_ss
 
         # Stator flux estimate
         fbk.psi_s = par.L_sgm*self.est.i_s + fbk.psi_R
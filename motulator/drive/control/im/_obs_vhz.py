@@ -1,6 +1,7 @@
 """Observer-based V/Hz control for induction machine drives."""
 
 # %%
+import cmath
 from types import SimpleNamespace
 from dataclasses import dataclass
 
@@ -87,6 +88,11 @@ class ObserverBasedVHzControl(DriveControlSystem):
         # Unpack
         par, cfg = self.par, self.cfg
 
+        # Rotation factor for the coordinate transformations, also reused
+        # (conjugated) in the reference voltage computation
+        fbk.theta_s = self.theta_s
+        rot = cmath.exp(-1j*fbk.theta_s)
+
         # Define the reference voltage computation
         def reference_voltage(fbk, ref):
             # Internal current reference for state feedback
@@ -98,7 +104,7 @@ class ObserverBasedVHzControl(DriveControlSystem):
             ref.u_s = (
                 par.R_s*ref.i_s + 1j*fbk.w_s*ref.psi_s +
                 par.L_sgm*cfg.alpha_psi*(ref.i_s - fbk.i_s))
-            u_ss = ref.u_s*np.exp(1j*fbk.theta_s)
+            u_ss = ref.u_s*rot.conjugate()
             ref.d_abc = self.pwm(ref.T_s, u_ss, fbk.u_dc, fbk.w_s)
             return ref
 
@@ -109,9 +115,8 @@ class ObserverBasedVHzControl(DriveControlSystem):
         ref.psi_s, ref.tau_M = self.cfg.nom_psi_s, self.ref.tau_M
 
         # Coordinate transformations
-        fbk.theta_s = self.theta_s
-        fbk.i_s = np.exp(-1j*fbk.theta_s)*fbk.i_ss
-        fbk.u_s = np.exp(-1j*fbk.theta_s)*fbk.u_ss
+        fbk.i_s = rot*fbk.i_ss
+        fbk.u_s = rot*fbk.u_ss
 
         # Torque and slip estimates
         fbk.tau_M = 1.5*par.n_p*np.imag(fbk.i_s*np.conj(fbk.psi_R))
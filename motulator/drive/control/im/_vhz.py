@@ -1,6 +1,7 @@
 """V/Hz control for induction motor drives."""
 
 # %%
+import cmath
 from dataclasses import dataclass, field, InitVar
 from types import SimpleNamespace
 
@@ -70,8 +71,10 @@ class VHzControl(DriveControlSystem):
         """Get the feedback signals."""
         fbk = super().get_feedback_signals(mdl)
         fbk.theta_s = self.theta_s
-        fbk.i_s = np.exp(-1j*fbk.theta_s)*fbk.i_ss
-        fbk.u_s = np.exp(-1j*fbk.theta_s)*fbk.u_ss
+        # Single rotation factor shared between the transforms
+        rot = cmath.exp(-1j*fbk.theta_s)
+        fbk.i_s = rot*fbk.i_ss
+        fbk.u_s = rot*fbk.u_ss
 
         return fbk
 
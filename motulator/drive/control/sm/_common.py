@@ -1,5 +1,6 @@
 """Common control functions and classes for for synchronous machine drives."""
 
+import math
 from types import SimpleNamespace
 from dataclasses import dataclass, field, InitVar
 
@@ -148,9 +149,11 @@ class Observer:
         if self.sensorless:
             fbk.theta_m, fbk.w_m = self.est.theta_m, self.est.w_m
 
-        # Current and voltage vectors in (estimated) rotor coordinates
-        fbk.i_s = np.exp(-1j*fbk.theta_m)*fbk.i_ss
-        fbk.u_s = np.exp(-1j*fbk.theta_m)*fbk.u_ss
+        # Current and voltage vectors in (estimated) rotor coordinates. The
+        # rotation factor is computed once and reused in both transforms.
+        rot = complex(math.cos(fbk.theta_m), -math.sin(fbk.theta_m))
+        fbk.i_s = rot*fbk.i_ss
+        fbk.u_s = rot*fbk.u_ss
 
         # Current estimation error, scaled by the stator inductances
         e = (
@@ -164,15 +167,18 @@ class Observer:
         if self.sensorless:
             # Observer gains
             k_o1 = gain.k_o(fbk.w_m)
-            k_o2 = k_o1*psi_a/np.conj(psi_a) if np.abs(psi_a) > 0 else k_o1
-
-            # Error term for the rotor angle and speed estimation
-            eps_m = -np.imag(e/psi_a) if np.abs(psi_a) > 0 else 0
+            k_o2 = k_o1*psi_a/np.conj(psi_a) if psi_a != 0 else k_o1
+
+            # Error terms for the rotor angle, speed, and PM-flux estimation,
+            # sharing a single division. The comparison against zero avoids
+            # evaluating the magnitude on the hot path.
+            if psi_a != 0:
+                ratio = e/psi_a
+                eps_m, eps_f = -ratio.imag, -ratio.real
+            else:
+                eps_m, eps_f = 0, 0
             # Angular speed of the coordinate system
             fbk.w_s = 2*gain.alpha_o*eps_m + fbk.w_m
-
-            # Error term for the PM-flux estimation
-            eps_f = -np.real(e/psi_a) if np.abs(psi_a) > 0 else 0
         else:
             # Sensored mode assumes that the control system operates in the
             # measured rotor coordinates
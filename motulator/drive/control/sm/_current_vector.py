@@ -1,5 +1,6 @@
 """Current-vector control methods for synchronous machine drives."""
 
+import cmath
 from dataclasses import dataclass, InitVar
 
 import numpy as np
@@ -75,8 +76,9 @@ class CurrentVectorControl(DriveControlSystem):
 
         if not self.observer:
             # No observer, use the measured values
-            fbk.i_s = np.exp(-1j*fbk.theta_m)*fbk.i_ss
-            fbk.u_s = np.exp(-1j*fbk.theta_m)*fbk.u_ss
+            rot = cmath.exp(-1j*fbk.theta_m)
+            fbk.i_s = rot*fbk.i_ss
+            fbk.u_s = rot*fbk.u_ss
             fbk.w_s = fbk.w_m  # Angular speed of the coordinate system
 
         return fbk
@@ -1,5 +1,6 @@
 """Observer-based V/Hz control of synchronous motor drives."""
 
+import cmath
 from types import SimpleNamespace
 from dataclasses import dataclass, InitVar
 
@@ -89,10 +90,12 @@ class ObserverBasedVHzControl(DriveControlSystem):
         ref.w_m = self.rate_limiter(ref.T_s, self.ref.w_m(ref.t))
         ref.tau_M = self.ref.tau_M
 
-        # Coordinate transformations
+        # Coordinate transformations, sharing a single rotation factor that
+        # is also reused (conjugated) for the voltage reference below
         fbk.theta_s = self.theta_s
-        fbk.i_s = np.exp(-1j*fbk.theta_s)*fbk.i_ss
-        fbk.u_s = np.exp(-1j*fbk.theta_s)*fbk.u_ss
+        rot = cmath.exp(-1j*fbk.theta_s)
+        fbk.i_s = rot*fbk.i_ss
+        fbk.u_s = rot*fbk.u_ss
 
         # Limited flux references
         ref = self.flux_torque_reference(fbk, ref)
@@ -106,7 +109,7 @@ class ObserverBasedVHzControl(DriveControlSystem):
         # Voltage reference
         err = ref.psi_s - fbk.psi_s
         ref.u_s = par.R_s*fbk.i_s + 1j*fbk.w_s*ref.psi_s + cfg.alpha_psi*err
-        u_ss = ref.u_s*np.exp(1j*fbk.theta_s)
+        u_ss = ref.u_s*rot.conjugate()
         ref.d_abc = self.pwm(ref.T_s, u_ss, fbk.u_dc, fbk.w_s)
         return ref
 
@@ -163,15 +166,16 @@ class FluxObserver:
 
         # Transformations to rotor coordinates. This is mathematically
         # equivalent to the version in [Tii2022].
-        i_sr = fbk.i_s*np.exp(1j*fbk.delta)
-        psi_sr = fbk.psi_s*np.exp(1j*fbk.delta)
+        rot_delta = cmath.exp(1j*fbk.delta)
+        i_sr = fbk.i_s*rot_delta
+        psi_sr = fbk.psi_s*rot_delta
 
         # Auxiliary flux and estimation error in rotor coordinates
         psi_ar = par.psi_f + (par.L_d - par.L_q)*np.conj(i_sr)
         e_r = par.L_d*i_sr.real + 1j*par.L_q*i_sr.imag + par.psi_f - psi_sr
 
         # Auxiliary flux in controller coordinates
-        psi_a = np.exp(-1j*fbk.delta)*psi_ar
+        psi_a = rot_delta.conjugate()*psi_ar
 
         k = self.b_p + 2*self.zeta_inf*np.abs(fbk.w_s)
 
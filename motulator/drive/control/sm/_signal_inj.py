@@ -1,6 +1,8 @@
 """Sensorless control with signal injection for synchronous machine drives."""
 
+import cmath
 from types import SimpleNamespace
+
 import numpy as np
 
 from motulator.drive.control import DriveControlSystem, SpeedController
@@ -62,9 +64,11 @@ class SignalInjectionControl(DriveControlSystem):
         fbk.w_m = self.pll.state.w_m
         fbk.theta_m = self.pll.state.theta_m
 
-        # Current vector in (estimated) rotor coordinates
-        fbk.i_s = np.exp(-1j*fbk.theta_m)*fbk.i_ss
-        fbk.u_s = np.exp(-1j*fbk.theta_m)*fbk.u_ss
+        # Current and voltage vectors in (estimated) rotor coordinates,
+        # sharing a single rotation factor
+        rot = cmath.exp(-1j*fbk.theta_m)
+        fbk.i_s = rot*fbk.i_ss
+        fbk.u_s = rot*fbk.u_ss
 
         # Filter the current measurement for the current controller
         fbk.i_s_flt = self.signal_inj.filter_current(fbk.i_s)
@@ -139,8 +143,7 @@ class SignalInjection:
 
         """
         di_sq = i_sq - 2*self._old_i_s.imag + self._older_i_s.imag
-        err = (self.k/T_s)*di_sq/self.u_sd_inj if np.abs(
-            self.u_sd_inj) > 0 else 0
+        err = (self.k/T_s)*di_sq/self.u_sd_inj if self.u_sd_inj != 0 else 0
 
         return err
 
@@ -209,9 +212,8 @@ class PhaseLockedLoop:
             Rotor position error (rad).
 
         """
-        # Speed estimation
-        w_m = self.gain.k_p*err + self.state.w_m
-
-        # Update the states
+        # Both integrator states are advanced in one fused pass; the angle
+        # integrates the pre-update speed plus the proportional correction
+        self.state.theta_m = wrap(
+            self.state.theta_m + T_s*(self.gain.k_p*err + self.state.w_m))
         self.state.w_m += T_s*self.gain.k_i*err
-        self.state.theta_m = wrap(self.state.theta_m + T_s*w_m)
@@ -1,4 +1,5 @@
 """Continuous-time machine drive models."""
+from motulator.common.model._parallel import simulate_parallel
 from motulator.common.model._simulation import (
     CarrierComparison, Delay, Simulation)
 from motulator.drive.model._drive import Drive, DriveWithLCFilter
@@ -12,6 +13,7 @@ __all__ = [
     "CarrierComparison",
     "Delay",
     "Simulation",
+    "simulate_parallel",
     "Drive",
     "DriveWithLCFilter",
     "FrequencyConverter",
@@ -45,6 +45,8 @@ class InductionMachine(Subsystem):
     def __init__(self, par):
         super().__init__()
         self.par = par
+        # Resolve the saturation model once instead of on every rhs call
+        self._L_s_fun = par.L_s if callable(par.L_s) else None
         # States
         self.state = SimpleNamespace(psi_ss=0j, psi_rs=0j)
         # Store the solutions in these lists
@@ -53,8 +55,8 @@ class InductionMachine(Subsystem):
     @property
     def L_s(self):
         """Stator inductance (H)."""
-        if callable(self.par.L_s):
-            return self.par.L_s(np.abs(self.state.psi_ss))
+        if self._L_s_fun is not None:
+            return self._L_s_fun(np.abs(self.state.psi_ss))
         return self.par.L_s
 
     @property
@@ -145,7 +147,7 @@ class SynchronousMachine(Subsystem):
     @property
     def i_s(self):
         """Stator current (A)."""
-        if callable(self._i_s):
+        if self._i_s is not None:
             return self._i_s(self.state.psi_s)
         return ((self.state.psi_s.real - self.par.psi_f)/self.par.L_d +
                 1j*self.state.psi_s.imag/self.par.L_q)
@@ -31,6 +31,8 @@ class StiffMechanicalSystem(Subsystem):
         super().__init__()
         self.par = SimpleNamespace(J=J, B_L=B_L)
         self.tau_L = tau_L
+        # Resolve the friction model once instead of on every rhs call
+        self._B_L_fun = B_L if callable(B_L) else None
         # Complex exponent is used to represent the rotor angle to provide
         # continuity in the angle representation and to avoid wrapping issues.
         self.state = SimpleNamespace(w_M=0, exp_j_theta_M=complex(1))
@@ -39,8 +41,8 @@ class StiffMechanicalSystem(Subsystem):
     @property
     def B_L(self):
         """Friction coefficient (Nm/(rad/s))."""
-        if callable(self.par.B_L):
-            return self.par.B_L(np.abs(self.state.w_M))
+        if self._B_L_fun is not None:
+            return self._B_L_fun(np.abs(self.state.w_M))
         return self.par.B_L
 
     def set_outputs(self, t):
@@ -83,7 +85,9 @@ class StiffMechanicalSystem(Subsystem):
 
     def post_process_states(self):
         """Post-process data."""
-        self.data.w_M = self.data.w_M.real
+        # Extract the real-valued trajectory as a contiguous array, since
+        # the real part of a complex array is a strided view
+        self.data.w_M = np.ascontiguousarray(self.data.w_M.real)
         self.data.theta_M = np.angle(self.data.exp_j_theta_M)
 
     def post_process_with_inputs(self):
@@ -112,6 +116,7 @@ class TwoMassMechanicalSystem(StiffMechanicalSystem):
     def __init__(self, par, tau_L=lambda t: 0*t):
         super().__init__(J=None, B_L=None, tau_L=tau_L)
         self.par = par
+        self._B_L_fun = par.B_L if callable(par.B_L) else None
         self.state = SimpleNamespace(w_M=0, exp_j_theta_M=0, w_L=0, theta_ML=0)
         self.sol_states = SimpleNamespace(
             w_M=[], exp_j_theta_M=[], w_L=[], theta_ML=[])
@@ -120,8 +125,8 @@ class TwoMassMechanicalSystem(StiffMechanicalSystem):
     def B_L(self):
         """Friction coefficient (Nm/(rad/s))."""
         # Overwrite the base class property
-        if callable(self.par.B_L):
-            return self.par.B_L(np.abs(self.state.w_L.real))
+        if self._B_L_fun is not None:
+            return self._B_L_fun(np.abs(self.state.w_L.real))
         return self.par.B_L
 
     def set_outputs(self, t):
@@ -155,8 +160,8 @@ class TwoMassMechanicalSystem(StiffMechanicalSystem):
     def post_process_states(self):
         """Post-process data."""
         super().post_process_states()
-        self.data.w_L = self.data.w_L.real
-        self.data.theta_ML = self.data.theta_ML.real
+        self.data.w_L = np.ascontiguousarray(self.data.w_L.real)
+        self.data.theta_ML = np.ascontiguousarray(self.data.theta_ML.real)
 
     def post_process_with_inputs(self):
         """Post-process data with inputs."""
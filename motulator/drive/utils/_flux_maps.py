@@ -16,6 +16,21 @@ plt.rcParams["axes.grid"] = True
 plt.rcParams.update({"text.usetex": False})
 
 
+# %%
+def _pack_complex(re, im):
+    """
+    Pack the real and imaginary components into a complex array.
+
+    The components are written through the real and imaginary views of a
+    single allocation, avoiding the temporary arrays that the expression
+    ``re + 1j*im`` would create.
+
+    """
+    out = np.empty(np.broadcast(re, im).shape, dtype=complex)
+    out.real, out.imag = re, im
+    return out
+
+
 # %%
 def import_syre_data(fname, add_negative_q_axis=True):
     """
@@ -76,8 +91,8 @@ def import_syre_data(fname, add_negative_q_axis=True):
         tau_M = np.concatenate((-np.flipud(tau_M), tau_M))
 
     # Pack the data in the complex form
-    i_s = i_d + 1j*i_q
-    psi_s = psi_d + 1j*psi_q
+    i_s = _pack_complex(i_d, i_q)
+    psi_s = _pack_complex(psi_d, psi_q)
 
     return SimpleNamespace(i_s=i_s, psi_s=psi_s, tau_M=tau_M)
 
@@ -217,7 +232,7 @@ def downsample_flux_map(data, N_d=32, N_q=32):
     points = (np.ravel(data.i_s.real), np.ravel(data.i_s.imag))
     psi_s = griddata(points, np.ravel(data.psi_s), (i_d, i_q), method="linear")
     tau_M = griddata(points, np.ravel(data.tau_M), (i_d, i_q), method="linear")
-    i_s = i_d + 1j*i_q
+    i_s = _pack_complex(i_d, i_q)
 
     return SimpleNamespace(i_s=i_s, psi_s=psi_s, tau_M=tau_M)
 
@@ -263,6 +278,6 @@ def invert_flux_map(data, N_d=32, N_q=32):
     i_s = griddata(points, np.ravel(data.i_s), (psi_d, psi_q), method="linear")
     tau_M = griddata(
         points, np.ravel(data.tau_M), (psi_d, psi_q), method="linear")
-    psi_s = psi_d + 1j*psi_q
+    psi_s = _pack_complex(psi_d, psi_q)
 
     return SimpleNamespace(psi_s=psi_s, i_s=i_s, tau_M=tau_M)
@@ -258,9 +258,10 @@ def plot_extra(sim, base=None, t_span=None):
     except AttributeError:
         theta = ctrl.fbk.theta_m  # Synchronous machine
 
-    # Quantities in stator coordinates
-    ctrl.fbk.u_ss = np.exp(1j*theta)*ctrl.fbk.u_s
-    ctrl.fbk.i_ss = np.exp(1j*theta)*ctrl.fbk.i_s
+    # Quantities in stator coordinates, sharing one rotation array
+    rot = np.exp(1j*theta)
+    ctrl.fbk.u_ss = rot*ctrl.fbk.u_s
+    ctrl.fbk.i_ss = rot*ctrl.fbk.i_s
 
     fig1, (ax1, ax2) = plt.subplots(2, 1)
 